@@ -1,8 +1,23 @@
+import functools
+
 import pytest
+from _pytest.doctest import DoctestItem
+
+
+@functools.cache
+def doctest_registry():
+    # creating a registry is expensive, so share it between all doctests
+    import pint
+
+    return pint.UnitRegistry(force_ndarray_like=True)
 
 
 @pytest.fixture(autouse=True)
-def add_standard_imports(doctest_namespace, tmpdir):
+def add_standard_imports(request):
+    # only doctests use the namespace, so don't pay for the setup elsewhere
+    if not isinstance(request.node, DoctestItem):
+        return
+
     import numpy as np
     import pandas as pd
     import pint
@@ -10,13 +25,12 @@ def add_standard_imports(doctest_namespace, tmpdir):
 
     import pint_xarray
 
-    ureg = pint.UnitRegistry(force_ndarray_like=True)
-
+    doctest_namespace = request.getfixturevalue("doctest_namespace")
     doctest_namespace["np"] = np
     doctest_namespace["pd"] = pd
     doctest_namespace["xr"] = xr
     doctest_namespace["pint"] = pint
-    doctest_namespace["ureg"] = ureg
+    doctest_namespace["ureg"] = doctest_registry()
     doctest_namespace["pint_xarray"] = pint_xarray
 
     # always seed numpy.random to make the examples deterministic
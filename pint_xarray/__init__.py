@@ -1,8 +1,9 @@
+from importlib import import_module
 from importlib.metadata import version
 
 import pint
 
-from . import accessors, formatting, testing  # noqa: F401
+from . import accessors, formatting  # noqa: F401
 from .accessors import default_registry as unit_registry
 from .accessors import setup_registry
 from .index import PintIndex
@@ -17,6 +18,24 @@ except Exception:
 
 pint.Quantity._repr_inline_ = formatting.inline_repr
 
+# submodules that are only imported on first access. Note that `accessors`
+# and `formatting` have to be imported eagerly since importing them registers
+# the accessors and the inline repr.
+_lazy_submodules = {"testing"}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_submodules)
+
 
 __all__ = [
     "testing",
@@ -1,5 +1,6 @@
 # TODO is it possible to import pint-xarray from within xarray if pint is present?
 import itertools
+import weakref
 
 import pint
 from pint import Unit
@@ -62,13 +63,17 @@ def zip_mappings(*mappings, fill_value=None):
     zipped : dict-like
         The zipped mapping
     """
-    keys = set(itertools.chain.from_iterable(mapping.keys() for mapping in mappings))
+    # fill the values in a single pass, keeping the order in which keys are
+    # first seen
+    zipped = {}
+    for index, mapping in enumerate(mappings):
+        for key, value in mapping.items():
+            values = zipped.get(key)
+            if values is None:
+                values = zipped[key] = [fill_value] * len(mappings)
+            values[index] = value
 
-    # TODO: could this be made more efficient using itertools.groupby?
-    zipped = {
-        key: tuple(mapping.get(key, fill_value) for mapping in mappings) for key in keys
-    }
-    return zipped
+    return {key: tuple(values) for key, values in zipped.items()}
 
 
 def units_to_str_or_none(mapping, unit_format):
@@ -122,6 +127,35 @@ def get_registry(unit_registry, new_units, existing_units):
     return unit_registry
 
 
+# parsed unit strings, per registry. To not keep the registries alive, only the
+# registry-independent unit containers are stored.
+_parsed_units = weakref.WeakKeyDictionary()
+
+
+def _parse_units(registry, units):
+    # pint only caches the result for plain unit names, so parsing compound
+    # expressions like "kg m / s**2" is repeated for every variable
+    if not isinstance(units, str):
+        return registry.parse_units(units)
+
+    if isinstance(registry, pint.ApplicationRegistry):
+        # the wrapped registry can be replaced, so don't use the wrapper as key
+        registry = registry.get()
+
+    # the result of parsing depends on the registry settings
+    key = (
+        units,
+        registry.default_as_delta,
+        registry.case_sensitive,
+        tuple(registry.preprocessors),
+    )
+    cache = _parsed_units.setdefault(registry, {})
+    if key not in cache:
+        cache[key] = registry.parse_units(units)._units
+
+    return registry.Unit(cache[key])
+
+
 def _decide_units(units, registry, unit_attribute):
     if units is _default and unit_attribute in (None, _default):
         # or warn and return None?
@@ -135,9 +169,9 @@ def _decide_units(units, registry, unit_attribute):
         if isinstance(unit_attribute, Unit):
             units = unit_attribute
         else:
-            units = registry.parse_units(unit_attribute)
+            units = _parse_units(registry, unit_attribute)
     else:
-        units = registry.parse_units(units)
+        units = _parse_units(registry, units)
     return units
 
 
@@ -152,7 +186,7 @@ class DatasetLocIndexer:
             raise NotImplementedError("pandas-style indexing is not supported, yet")
 
         dims = self.ds.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -164,8 +198,6 @@ class DatasetLocIndexer:
             raise KeyError(*e.args) from e
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
-
         stripped = conversion.strip_units(converted)
         converted_units = conversion.extract_units(converted)
         indexed = stripped.loc[stripped_indexers]
@@ -184,7 +216,7 @@ class DataArrayLocIndexer:
             raise NotImplementedError("pandas-style indexing is not supported, yet")
 
         dims = self.da.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -196,8 +228,6 @@ class DataArrayLocIndexer:
             raise KeyError(*e.args) from e
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
-
         stripped = conversion.strip_units(converted)
         converted_units = conversion.extract_units(converted)
         indexed = stripped.loc[stripped_indexers]
@@ -333,9 +363,8 @@ class PintDataArrayAccessor:
 
         units = either_dict_or_kwargs(units, unit_kwargs, "quantify")
 
-        registry = get_registry(unit_registry, units, conversion.extract_units(self.da))
-
-        unit_attrs = conversion.extract_unit_attributes(self.da)
+        all_units, unit_attrs = conversion.extract_units_and_unit_attributes(self.da)
+        registry = get_registry(unit_registry, units, all_units)
 
         possible_new_units = zip_mappings(units, unit_attrs, fill_value=_default)
         new_units = {}
@@ -357,10 +386,12 @@ class PintDataArrayAccessor:
         if invalid_units:
             raise ValueError(format_error_message(invalid_units, "parse"))
 
+        if not new_units:
+            # nothing to attach, only the unit attributes have to be removed
+            return conversion.strip_unit_attributes(self.da)
+
         existing_units = {
-            name: unit
-            for name, unit in conversion.extract_units(self.da).items()
-            if isinstance(unit, Unit)
+            name: unit for name, unit in all_units.items() if isinstance(unit, Unit)
         }
         overwritten_units = {
             name: (old, new)
@@ -443,17 +474,12 @@ class PintDataArrayAccessor:
         Attributes:
             units:    \frac{\mathrm{m}}{\mathrm{s}}
         """
-        units = conversion.extract_unit_attributes(self.da)
-        units.update(conversion.extract_units(self.da))
+        units = conversion.extract_units(self.da)
 
         unit_format = f"{{:{format}}}" if isinstance(format, str) else format
 
         units = units_to_str_or_none(units, unit_format)
-        return (
-            self.da.pipe(conversion.strip_units)
-            .pipe(conversion.strip_unit_attributes)
-            .pipe(conversion.attach_unit_attributes, units)
-        )
+        return conversion.dequantify(self.da, units)
 
     @property
     def magnitude(self):
@@ -578,6 +604,21 @@ class PintDataArrayAccessor:
             u        (x) float64 40B [ms] 0.0 1e+03 2e+03 3e+03 4e+03
         Dimensions without coordinates: x
         """
+        if (
+            isinstance(units, (str, pint.Unit))
+            and not unit_kwargs
+            and isinstance(self.da.data, pint.Quantity)
+        ):
+            # only the data has to be converted, so skip the dataset round-trip
+            try:
+                converted = conversion.array_convert_units(self.da.data, units)
+            except (ValueError, pint.errors.PintTypeError) as e:
+                raise ValueError(
+                    format_error_message({self.da.name: e}, "convert")
+                ) from e
+
+            return self.da.copy(deep=False, data=converted)
+
         if isinstance(units, (str, pint.Unit)):
             unit_kwargs[self.da.name] = units
             units = None
@@ -641,7 +682,7 @@ class PintDataArrayAccessor:
         indexers = either_dict_or_kwargs(indexers, indexers_kwargs, "reindex")
 
         dims = self.da.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -655,7 +696,6 @@ class PintDataArrayAccessor:
         stripped = conversion.strip_units(converted)
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
         indexed = stripped.reindex(
             stripped_indexers,
             method=method,
@@ -728,7 +768,7 @@ class PintDataArrayAccessor:
         indexers = either_dict_or_kwargs(coords, coords_kwargs, "interp")
 
         dims = self.da.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -739,7 +779,6 @@ class PintDataArrayAccessor:
         stripped = conversion.strip_units(converted)
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
         interpolated = stripped.interp(
             stripped_indexers,
             method=method,
@@ -799,7 +838,7 @@ class PintDataArrayAccessor:
         indexers = either_dict_or_kwargs(indexers, indexers_kwargs, "sel")
 
         dims = self.da.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -813,8 +852,6 @@ class PintDataArrayAccessor:
             raise KeyError(*e.args) from e
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
-
         stripped = conversion.strip_units(converted)
         converted_units = conversion.extract_units(converted)
         indexed = stripped.sel(
@@ -1069,9 +1106,8 @@ class PintDatasetAccessor:
             b        (x) int64 24B 5 -2 1
         """
         units = either_dict_or_kwargs(units, unit_kwargs, "quantify")
-        registry = get_registry(unit_registry, units, conversion.extract_units(self.ds))
-
-        unit_attrs = conversion.extract_unit_attributes(self.ds)
+        all_units, unit_attrs = conversion.extract_units_and_unit_attributes(self.ds)
+        registry = get_registry(unit_registry, units, all_units)
 
         possible_new_units = zip_mappings(units, unit_attrs, fill_value=_default)
         new_units = {}
@@ -1093,10 +1129,12 @@ class PintDatasetAccessor:
         if invalid_units:
             raise ValueError(format_error_message(invalid_units, "parse"))
 
+        if not new_units:
+            # nothing to attach, only the unit attributes have to be removed
+            return conversion.strip_unit_attributes(self.ds)
+
         existing_units = {
-            name: unit
-            for name, unit in conversion.extract_units(self.ds).items()
-            if isinstance(unit, Unit)
+            name: unit for name, unit in all_units.items() if isinstance(unit, Unit)
         }
         overwritten_units = {
             name: (old, new)
@@ -1204,17 +1242,12 @@ class PintDatasetAccessor:
         Attributes:
             units:    \mathrm{s}
         """
-        units = conversion.extract_unit_attributes(self.ds)
-        units.update(conversion.extract_units(self.ds))
+        units = conversion.extract_units(self.ds)
 
         unit_format = f"{{:{format}}}" if isinstance(format, str) else format
 
         units = units_to_str_or_none(units, unit_format)
-        return (
-            self.ds.pipe(conversion.strip_units)
-            .pipe(conversion.strip_unit_attributes)
-            .pipe(conversion.attach_unit_attributes, units)
-        )
+        return conversion.dequantify(self.ds, units)
 
     def to(self, units=None, **unit_kwargs):
         """convert the quantities in a Dataset
@@ -1410,7 +1443,7 @@ class PintDatasetAccessor:
         indexers = either_dict_or_kwargs(indexers, indexers_kwargs, "reindex")
 
         dims = self.ds.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -1424,7 +1457,6 @@ class PintDatasetAccessor:
         stripped = conversion.strip_units(converted)
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
         indexed = stripped.reindex(
             stripped_indexers,
             method=method,
@@ -1497,7 +1529,7 @@ class PintDatasetAccessor:
         indexers = either_dict_or_kwargs(coords, coords_kwargs, "interp")
 
         dims = self.ds.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -1508,7 +1540,6 @@ class PintDatasetAccessor:
         stripped = conversion.strip_units(converted)
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
         interpolated = stripped.interp(
             stripped_indexers,
             method=method,
@@ -1568,7 +1599,7 @@ class PintDatasetAccessor:
         indexers = either_dict_or_kwargs(indexers, indexers_kwargs, "sel")
 
         dims = self.ds.dims
-        indexer_units = conversion.extract_indexer_units(indexers)
+        indexer_units, stripped_indexers = conversion.split_indexer_units(indexers)
         indexer_units = {
             name: indexer for name, indexer in indexer_units.items() if name in dims
         }
@@ -1582,8 +1613,6 @@ class PintDatasetAccessor:
             raise KeyError(*e.args) from e
 
         # index
-        stripped_indexers = conversion.strip_indexer_units(indexers)
-
         stripped = conversion.strip_units(converted)
         converted_units = conversion.extract_units(converted)
         indexed = stripped.sel(
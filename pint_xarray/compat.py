@@ -1,18 +1,17 @@
 import xarray as xr
+from xarray import DataArray, Dataset
 
-try:
-    from xarray import call_on_dataset
-except ImportError:
+if hasattr(xr, "call_on_dataset"):
+    call_on_dataset = xr.call_on_dataset
+else:
 
     def call_on_dataset(func, obj, name, *args, **kwargs):
-        if isinstance(obj, xr.DataArray):
-            ds = obj.to_dataset(name=name)
-        else:
-            ds = obj
+        is_dataarray = isinstance(obj, DataArray)
+        ds = obj.to_dataset(name=name) if is_dataarray else obj
 
         result = func(ds, *args, **kwargs)
 
-        if isinstance(obj, xr.DataArray) and isinstance(result, xr.Dataset):
+        if is_dataarray and isinstance(result, Dataset):
             result = result.get(name).rename(obj.name)
 
         return result
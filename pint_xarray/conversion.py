@@ -333,24 +333,44 @@ def convert_units(obj, units):
     return new_obj
 
 
-def extract_units_dataset(obj):
-    return {name: array_extract_units(var.data) for name, var in obj.variables.items()}
+def extract_units_and_unit_attributes_dataset(obj, attr="units"):
+    units = {}
+    unit_attributes = {}
+    for name, var in obj.variables.items():
+        units[name] = array_extract_units(var.data)
 
+        unit = var.attrs.get(attr, None)
+        if not is_datetime_unit(unit):
+            unit_attributes[name] = unit
 
-def extract_units(obj):
+    return units, unit_attributes
+
+
+def extract_units_and_unit_attributes(obj, attr="units"):
+    """extract units and unit attributes in a single pass over the variables
+
+    Equivalent to ``(extract_units(obj), extract_unit_attributes(obj, attr))``.
+    """
     if not isinstance(obj, (DataArray, Dataset)):
         raise ValueError(f"unknown type: {type(obj)}")
 
-    unit_attributes = extract_unit_attributes(obj)
-
-    units = call_on_dataset(extract_units_dataset, obj, name=temporary_name)
-    if temporary_name in units:
-        units[obj.name] = units.pop(temporary_name)
+    units, unit_attributes = call_on_dataset(
+        extract_units_and_unit_attributes_dataset, obj, name=temporary_name, attr=attr
+    )
+    for mapping in (units, unit_attributes):
+        if temporary_name in mapping:
+            mapping[obj.name] = mapping.pop(temporary_name)
 
     units_ = unit_attributes.copy()
     units_.update({k: v for k, v in units.items() if v is not None})
 
-    return units_
+    return units_, unit_attributes
+
+
+def extract_units(obj):
+    units, _ = extract_units_and_unit_attributes(obj)
+
+    return units
 
 
 def extract_unit_attributes_dataset(obj, attr="units"):
@@ -422,6 +442,77 @@ def strip_unit_attributes(obj, attr="units"):
     )
 
 
+def dequantify_attrs(attrs, unit, attr="units"):
+    if not is_datetime_unit(attrs.get(attr, "")):
+        attrs.pop(attr, None)
+
+    if unit is not None:
+        attrs[attr] = unit
+
+
+def dequantify_variable(var, unit, attr="units"):
+    is_quantity = isinstance(var.data, pint.Quantity)
+    stale_attr = attr in var.attrs and not is_datetime_unit(var.attrs[attr])
+    if not is_quantity and not stale_attr and unit is None:
+        return var
+
+    if is_quantity:
+        new_var = var.copy(deep=False, data=array_strip_units(var.data))
+    else:
+        # avoid replacing the data, which would drop wrappers like the
+        # multi-index adapter of index variables
+        new_var = var.copy(deep=False)
+    dequantify_attrs(new_var.attrs, unit, attr=attr)
+
+    return new_var
+
+
+def dequantify_dataset(obj, units, attr="units"):
+    indexes = {}
+    index_vars = {}
+    for idx, idx_vars in obj.xindexes.group_by_index():
+        stripped_idx = idx.index if isinstance(idx, PintIndex) else idx
+        # indexes may return the variables they were given, so don't modify
+        # them in-place
+        new_vars = {
+            name: dequantify_variable(var, units.get(name), attr=attr)
+            for name, var in stripped_idx.create_variables(idx_vars).items()
+        }
+
+        indexes.update({name: stripped_idx for name in idx_vars})
+        index_vars.update(new_vars)
+
+    variables = {
+        name: (
+            index_vars[name]
+            if name in index_vars
+            else dequantify_variable(var, units.get(name), attr=attr)
+        )
+        for name, var in obj.variables.items()
+    }
+
+    return dataset_from_variables(variables, obj._coord_names, indexes, obj.attrs)
+
+
+def dequantify(obj, units, attr="units"):
+    """strip the units and store them as attributes in a single pass
+
+    Equivalent to stripping the units and unit attributes and then calling
+    ``attach_unit_attributes(obj, units, attr)``.
+    """
+    if not isinstance(obj, (DataArray, Dataset)):
+        raise ValueError(f"cannot dequantify {obj!r}: unknown type")
+
+    if isinstance(obj, DataArray):
+        units = units.copy()
+        if obj.name in units:
+            units[temporary_name] = units.get(obj.name)
+
+    return call_on_dataset(
+        dequantify_dataset, obj, name=temporary_name, units=units, attr=attr
+    )
+
+
 def slice_extract_units(indexer):
     elements = {name: getattr(indexer, name) for name in slice_attributes}
     extracted_units = [
@@ -487,31 +578,38 @@ def convert_indexer_units(indexers, units):
     return converted
 
 
-def extract_indexer_units(indexers):
-    def extract(indexer):
-        if isinstance(indexer, slice):
-            return slice_extract_units(indexer)
-        elif isinstance(indexer, (DataArray, Variable)):
-            return array_extract_units(indexer.data)
-        else:
-            return array_extract_units(indexer)
-
-    return {name: extract(indexer) for name, indexer in indexers.items()}
-
-
-def strip_indexer_units(indexers):
-    def strip(indexer):
+def split_indexer_units(indexers):
+    """extract the units of the indexers and strip them in a single pass"""
+    units = {}
+    stripped = {}
+    for name, indexer in indexers.items():
         if isinstance(indexer, slice):
-            return slice(
+            units[name] = slice_extract_units(indexer)
+            stripped[name] = slice(
                 array_strip_units(indexer.start),
                 array_strip_units(indexer.stop),
                 array_strip_units(indexer.step),
             )
         elif isinstance(indexer, DataArray):
-            return strip_units(indexer)
+            units[name] = array_extract_units(indexer.data)
+            stripped[name] = strip_units(indexer)
         elif isinstance(indexer, Variable):
-            return strip_units_variable(indexer)
+            units[name] = array_extract_units(indexer.data)
+            stripped[name] = strip_units_variable(indexer)
         else:
-            return array_strip_units(indexer)
+            units[name] = array_extract_units(indexer)
+            stripped[name] = array_strip_units(indexer)
+
+    return units, stripped
+
+
+def extract_indexer_units(indexers):
+    units, _ = split_indexer_units(indexers)
+
+    return units
+
+
+def strip_indexer_units(indexers):
+    _, stripped = split_indexer_units(indexers)
 
-    return {name: strip(indexer) for name, indexer in indexers.items()}
+    return stripped
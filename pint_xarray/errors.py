@@ -1,42 +1,52 @@
+single_separator = "\n    "
+multiple_separator = "\n -- "
+
+
+def _format_attach(mapping):
+    return (
+        f"cannot attach units to variable {key!r}: {unit} (reason: {e})"
+        for key, (unit, e) in mapping.items()
+    )
+
+
+def _format_parse(mapping):
+    return (
+        f"invalid units for variable {key!r}: {unit} ({type}) (reason: {e})"
+        for key, (unit, type, e) in mapping.items()
+    )
+
+
+def _format_convert(mapping):
+    return (
+        f"incompatible units for variable {key!r}: {error}"
+        for key, error in mapping.items()
+    )
+
+
+def _format_convert_indexers(mapping):
+    return (
+        f"incompatible units for indexer for {key!r}: {error}"
+        for key, error in mapping.items()
+    )
+
+
+_formatters = {
+    "attach": ("Cannot attach units:", _format_attach),
+    "parse": ("Cannot parse units:", _format_parse),
+    "convert": ("Cannot convert variables:", _format_convert),
+    "convert_indexers": ("Cannot convert indexers:", _format_convert_indexers),
+}
+
+
 def format_error_message(mapping, op):
-    sep = "\n    " if len(mapping) == 1 else "\n -- "
-    if op == "attach":
-        message = "Cannot attach units:"
-        message = sep.join(
-            [message]
-            + [
-                f"cannot attach units to variable {key!r}: {unit} (reason: {str(e)})"
-                for key, (unit, e) in mapping.items()
-            ]
-        )
-    elif op == "parse":
-        message = "Cannot parse units:"
-        message = sep.join(
-            [message]
-            + [
-                f"invalid units for variable {key!r}: {unit} ({type}) (reason: {str(e)})"
-                for key, (unit, type, e) in mapping.items()
-            ]
-        )
-    elif op == "convert":
-        message = "Cannot convert variables:"
-        message = sep.join(
-            [message]
-            + [
-                f"incompatible units for variable {key!r}: {error}"
-                for key, error in mapping.items()
-            ]
-        )
-    elif op == "convert_indexers":
-        message = "Cannot convert indexers:"
-        message = sep.join(
-            [message]
-            + [
-                f"incompatible units for indexer for {key!r}: {error}"
-                for key, error in mapping.items()
-            ]
-        )
-    else:
-        raise ValueError("invalid op")
-
-    return message
+    try:
+        header, formatter = _formatters[op]
+    except KeyError:
+        raise ValueError("invalid op") from None
+
+    if not mapping:
+        return header
+
+    sep = single_separator if len(mapping) == 1 else multiple_separator
+    entries = sep.join(formatter(mapping))
+    return f"{header}{sep}{entries}"
@@ -16,14 +16,15 @@ def assert_units_equal(a, b):
 
     __tracebackhide__ = True
 
-    units_a = conversion.extract_units(a)
-    units_b = conversion.extract_units(b)
+    if a is b:
+        return
+
+    units_a, unit_attrs_a = conversion.extract_units_and_unit_attributes(a)
+    units_b, unit_attrs_b = conversion.extract_units_and_unit_attributes(b)
     assert units_a == units_b, formatting._diff_mapping_repr(
         units_a, units_b, "Units", formatting.summarize_attr
     )
 
-    unit_attrs_a = conversion.extract_unit_attributes(a)
-    unit_attrs_b = conversion.extract_unit_attributes(b)
     assert unit_attrs_a == unit_attrs_b, formatting._diff_mapping_repr(
         unit_attrs_a, unit_attrs_b, "Unit attrs", formatting.summarize_attr
     )
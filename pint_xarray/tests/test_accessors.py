@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import numpy as np
 import pandas as pd
 import pint
@@ -12,6 +15,7 @@ from .utils import (
     assert_equal,
     assert_identical,
     assert_units_equal,
+    assert_wraps_no_copy,
     requires_bottleneck,
     requires_dask_array,
     requires_scipy,
@@ -29,6 +33,12 @@ Quantity = unit_registry.Quantity
 
 nan = np.nan
 
+# unit objects shared by the parametrize tables below
+unit_m = unit_registry.Unit("m")
+unit_dm = unit_registry.Unit("dm")
+unit_s = unit_registry.Unit("s")
+unit_min = unit_registry.Unit("min")
+
 
 def assert_all_str_or_none(mapping):
     __tracebackhide__ = True
@@ -42,8 +52,10 @@ def assert_all_str_or_none(mapping):
     assert check, f"Not all values are str or None: {not_passing}"
 
 
-@pytest.fixture
-def example_unitless_da():
+# the example objects are built once per module and handed out as deep
+# copies, since some tests modify them in-place
+@pytest.fixture(scope="module")
+def _example_unitless_da():
     array = np.linspace(0, 10, 20)
     x = np.arange(20)
     u = np.linspace(0, 1, 20)
@@ -56,19 +68,30 @@ def example_unitless_da():
     return da
 
 
-@pytest.fixture()
-def example_quantity_da():
+@pytest.fixture
+def example_unitless_da(_example_unitless_da):
+    return _example_unitless_da.copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def _example_quantity_da():
     array = np.linspace(0, 10, 20) * unit_registry.m
     x = np.arange(20)
     u = np.linspace(0, 1, 20) * unit_registry.hour
     return xr.DataArray(data=array, dims="x", coords={"x": ("x", x), "u": ("x", u)})
 
 
+@pytest.fixture
+def example_quantity_da(_example_quantity_da):
+    return _example_quantity_da.copy(deep=True)
+
+
 class TestQuantifyDataArray:
     def test_attach_units_from_str(self, example_unitless_da):
         orig = example_unitless_da
         result = orig.pint.quantify("s")
         assert_array_equal(result.data.magnitude, orig.data)
+        assert_wraps_no_copy(result.data, orig.data)
         # TODO better comparisons for when you can't access the unit_registry?
         assert str(result.data.units) == "second"
 
@@ -77,12 +100,14 @@ class TestQuantifyDataArray:
         ureg = UnitRegistry(force_ndarray=True)
         result = orig.pint.quantify("m", unit_registry=ureg)
         assert_array_equal(result.data.magnitude, orig.data)
+        assert_wraps_no_copy(result.data, orig.data)
         assert result.data.units == ureg.Unit("m")
 
     def test_attach_units_from_attrs(self, example_unitless_da):
         orig = example_unitless_da
         result = orig.pint.quantify()
         assert_array_equal(result.data.magnitude, orig.data)
+        assert_wraps_no_copy(result.data, orig.data)
         assert str(result.data.units) == "meter"
 
         remaining_attrs = conversion.extract_unit_attributes(result)
@@ -93,6 +118,7 @@ class TestQuantifyDataArray:
         orig.attrs["units"] = "none"
         result = orig.pint.quantify("m")
         assert_array_equal(result.data.magnitude, orig.data)
+        assert_wraps_no_copy(result.data, orig.data)
         assert str(result.data.units) == "meter"
 
     def test_attach_units_given_unit_objs(self, example_unitless_da):
@@ -100,6 +126,7 @@ class TestQuantifyDataArray:
         ureg = UnitRegistry(force_ndarray=True)
         result = orig.pint.quantify(ureg.Unit("m"), unit_registry=ureg)
         assert_array_equal(result.data.magnitude, orig.data)
+        assert_wraps_no_copy(result.data, orig.data)
         assert result.data.units == ureg.Unit("m")
 
     @pytest.mark.parametrize("no_unit_value", conversion.no_unit_values)
@@ -139,7 +166,7 @@ class TestQuantifyDataArray:
         arr = xr.DataArray(
             [1, 2, 3],
             dims="x",
-            coords={"x": ("x", [-1, 0, 1], {"units": unit_registry.Unit("m")})},
+            coords={"x": ("x", [-1, 0, 1], {"units": unit_m})},
         )
         with pytest.raises(ValueError, match="already has units"):
             arr.pint.quantify({"x": "s"})
@@ -154,7 +181,7 @@ class TestQuantifyDataArray:
         assert isinstance(q.attrs["units"], Unit)
 
     def test_dimension_coordinate_array_already_quantified(self):
-        ds = xr.Dataset(coords={"x": ("x", [10], {"units": unit_registry.Unit("m")})})
+        ds = xr.Dataset(coords={"x": ("x", [10], {"units": unit_m})})
         arr = ds.x
 
         with pytest.raises(ValueError):
@@ -216,6 +243,64 @@ def test_units_to_str_or_none(formatter, modifier):
     assert expected == accessors.units_to_str_or_none(expected, unit_format)
 
 
+def test_zip_mappings():
+    first = {"b": 1, "a": 2}
+    second = {"c": 3, "a": 4}
+
+    actual = accessors.zip_mappings(first, second, fill_value=0)
+    expected = {"b": (1, 0), "a": (2, 4), "c": (0, 3)}
+
+    assert actual == expected
+    assert list(actual) == ["b", "a", "c"]
+
+
+def test_parse_units_per_registry():
+    ureg = UnitRegistry(force_ndarray=True)
+
+    units = accessors._parse_units(ureg, "kg m / s**2")
+    assert units == ureg.Unit("kg m / s**2")
+    assert units._REGISTRY is ureg
+
+    other = accessors._parse_units(unit_registry, "kg m / s**2")
+    assert other._REGISTRY is unit_registry.get()
+
+
+def test_parse_units_registry_settings():
+    ureg = UnitRegistry(force_ndarray=True)
+
+    assert accessors._parse_units(ureg, "degC / s") == ureg.Unit("delta_degC / s")
+
+    ureg.default_as_delta = False
+    assert accessors._parse_units(ureg, "degC / s") == ureg.Unit("degC / s")
+
+    ureg.case_sensitive = False
+    assert accessors._parse_units(ureg, "Meter / Second") == ureg.Unit("m / s")
+
+    ureg.case_sensitive = True
+    with pytest.raises(pint.errors.UndefinedUnitError):
+        accessors._parse_units(ureg, "Meter / Second")
+
+
+def test_parse_units_preprocessors():
+    ureg = UnitRegistry(force_ndarray=True)
+
+    assert accessors._parse_units(ureg, "m / s") == ureg.Unit("m / s")
+
+    ureg.preprocessors.append(lambda s: s.replace("s", "h"))
+    assert accessors._parse_units(ureg, "m / s") == ureg.Unit("m / hour")
+
+
+def test_parse_units_releases_registry():
+    ureg = UnitRegistry(force_ndarray=True)
+    accessors._parse_units(ureg, "kg m / s**2")
+
+    ref = weakref.ref(ureg)
+    del ureg
+    gc.collect()
+
+    assert ref() is None
+
+
 class TestDequantifyDataArray:
     def test_strip_units(self, example_quantity_da):
         result = example_quantity_da.pint.dequantify()
@@ -281,8 +366,8 @@ class TestPropertiesDataArray:
         assert da.pint.units == unit_registry.s
 
 
-@pytest.fixture()
-def example_unitless_ds():
+@pytest.fixture(scope="module")
+def _example_unitless_ds():
     users = np.linspace(0, 10, 20)
     funds = np.logspace(0, 10, 20)
     t = np.arange(20)
@@ -294,8 +379,13 @@ def example_unitless_ds():
     return ds
 
 
-@pytest.fixture()
-def example_quantity_ds():
+@pytest.fixture
+def example_unitless_ds(_example_unitless_ds):
+    return _example_unitless_ds.copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def _example_quantity_ds():
     users = np.linspace(0, 10, 20) * unit_registry.dimensionless
     funds = np.logspace(0, 10, 20) * unit_registry.pound
     t = np.arange(20)
@@ -305,11 +395,17 @@ def example_quantity_ds():
     return ds
 
 
+@pytest.fixture
+def example_quantity_ds(_example_quantity_ds):
+    return _example_quantity_ds.copy(deep=True)
+
+
 class TestQuantifyDataSet:
     def test_attach_units_from_str(self, example_unitless_ds):
         orig = example_unitless_ds
         result = orig.pint.quantify()
         assert_array_equal(result["users"].data.magnitude, orig["users"].data)
+        assert_wraps_no_copy(result["users"].data, orig["users"].data)
         assert str(result["users"].data.units) == "dimensionless"
 
     def test_attach_units_given_registry(self, example_unitless_ds):
@@ -319,6 +415,7 @@ class TestQuantifyDataSet:
             {"users": "dimensionless"}, unit_registry=unit_registry
         )
         assert_array_equal(result["users"].data.magnitude, orig["users"].data)
+        assert_wraps_no_copy(result["users"].data, orig["users"].data)
         assert str(result["users"].data.units) == "dimensionless"
 
     def test_attach_units_from_attrs(self, example_unitless_ds):
@@ -326,6 +423,7 @@ class TestQuantifyDataSet:
         orig["users"].attrs.clear()
         result = orig.pint.quantify({"users": "dimensionless"})
         assert_array_equal(result["users"].data.magnitude, orig["users"].data)
+        assert_wraps_no_copy(result["users"].data, orig["users"].data)
         assert str(result["users"].data.units) == "dimensionless"
 
         remaining_attrs = conversion.extract_unit_attributes(result)
@@ -337,6 +435,7 @@ class TestQuantifyDataSet:
         dimensionless = unit_registry.Unit("dimensionless")
         result = orig.pint.quantify({"users": dimensionless})
         assert_array_equal(result["users"].data.magnitude, orig["users"].data)
+        assert_wraps_no_copy(result["users"].data, orig["users"].data)
         assert str(result["users"].data.units) == "dimensionless"
 
     def test_attach_units_from_str_attr_no_unit(self, example_unitless_ds):
@@ -344,6 +443,7 @@ class TestQuantifyDataSet:
         orig["users"].attrs["units"] = "none"
         result = orig.pint.quantify({"users": "m"})
         assert_array_equal(result["users"].data.magnitude, orig["users"].data)
+        assert_wraps_no_copy(result["users"].data, orig["users"].data)
         assert str(result["users"].data.units) == "meter"
 
     @pytest.mark.parametrize("no_unit_value", conversion.no_unit_values)
@@ -380,7 +480,7 @@ class TestQuantifyDataSet:
 
     def test_error_when_changing_units_dimension_coordinates(self):
         ds = xr.Dataset(
-            coords={"x": ("x", [-1, 0, 1], {"units": unit_registry.Unit("m")})},
+            coords={"x": ("x", [-1, 0, 1], {"units": unit_m})},
         )
         with pytest.raises(ValueError, match="already has units"):
             ds.pint.quantify({"x": "s"})
@@ -405,14 +505,14 @@ class TestQuantifyDataSet:
 
     def test_existing_units(self, example_quantity_ds):
         ds = example_quantity_ds.copy()
-        ds.t.attrs["units"] = unit_registry.Unit("m")
+        ds.t.attrs["units"] = unit_m
 
         with pytest.raises(ValueError, match="Cannot attach"):
             ds.pint.quantify({"funds": "kg"})
 
     def test_existing_units_dimension(self, example_quantity_ds):
         ds = example_quantity_ds.copy()
-        ds.t.attrs["units"] = unit_registry.Unit("m")
+        ds.t.attrs["units"] = unit_m
 
         with pytest.raises(ValueError, match="Cannot attach"):
             ds.pint.quantify({"t": "s"})
@@ -576,21 +676,22 @@ def test_to(obj, units, expected, error):
         assert_identical(actual, expected)
 
 
-@pytest.mark.parametrize(
+# shared by test_sel and test_loc
+sel_loc_params = pytest.mark.parametrize(
     ["obj", "indexers", "expected", "error"],
     (
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
             xr.Dataset(
                 {
-                    "x": ("x", [10, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 30], {"units": unit_dm}),
+                    "y": ("y", [60], {"units": unit_s}),
                 }
             ),
             None,
@@ -599,15 +700,15 @@ def test_to(obj, units, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
             xr.Dataset(
                 {
-                    "x": ("x", [1, 3], {"units": unit_registry.Unit("m")}),
-                    "y": ("y", [1], {"units": unit_registry.Unit("min")}),
+                    "x": ("x", [1, 3], {"units": unit_m}),
+                    "y": ("y", [1], {"units": unit_min}),
                 }
             ),
             None,
@@ -616,8 +717,8 @@ def test_to(obj, units, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([1, 3], "s"), "y": Quantity([1], "m")},
@@ -630,8 +731,8 @@ def test_to(obj, units, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -639,8 +740,8 @@ def test_to(obj, units, expected, error):
                 [[0], [4]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 30], {"units": unit_dm}),
+                    "y": ("y", [60], {"units": unit_s}),
                 },
             ),
             None,
@@ -651,8 +752,8 @@ def test_to(obj, units, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
@@ -660,8 +761,8 @@ def test_to(obj, units, expected, error):
                 [[0], [4]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [1, 3], {"units": unit_registry.Unit("m")}),
-                    "y": ("y", [1], {"units": unit_registry.Unit("min")}),
+                    "x": ("x", [1, 3], {"units": unit_m}),
+                    "y": ("y", [1], {"units": unit_min}),
                 },
             ),
             None,
@@ -672,8 +773,8 @@ def test_to(obj, units, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "s"), "y": Quantity([60], "m")},
@@ -683,6 +784,9 @@ def test_to(obj, units, expected, error):
         ),
     ),
 )
+
+
+@sel_loc_params
 def test_sel(obj, indexers, expected, error):
     obj_ = obj.pint.quantify()
 
@@ -697,113 +801,7 @@ def test_sel(obj, indexers, expected, error):
         assert_identical(actual, expected_)
 
 
-@pytest.mark.parametrize(
-    ["obj", "indexers", "expected", "error"],
-    (
-        pytest.param(
-            xr.Dataset(
-                {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                }
-            ),
-            {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
-            xr.Dataset(
-                {
-                    "x": ("x", [10, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60], {"units": unit_registry.Unit("s")}),
-                }
-            ),
-            None,
-            id="Dataset-identical units",
-        ),
-        pytest.param(
-            xr.Dataset(
-                {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                }
-            ),
-            {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
-            xr.Dataset(
-                {
-                    "x": ("x", [1, 3], {"units": unit_registry.Unit("m")}),
-                    "y": ("y", [1], {"units": unit_registry.Unit("min")}),
-                }
-            ),
-            None,
-            id="Dataset-compatible units",
-        ),
-        pytest.param(
-            xr.Dataset(
-                {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                }
-            ),
-            {"x": Quantity([1, 3], "s"), "y": Quantity([1], "m")},
-            None,
-            KeyError,
-            id="Dataset-incompatible units",
-        ),
-        pytest.param(
-            xr.DataArray(
-                [[0, 1], [2, 3], [4, 5]],
-                dims=("x", "y"),
-                coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                },
-            ),
-            {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
-            xr.DataArray(
-                [[0], [4]],
-                dims=("x", "y"),
-                coords={
-                    "x": ("x", [10, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60], {"units": unit_registry.Unit("s")}),
-                },
-            ),
-            None,
-            id="DataArray-identical units",
-        ),
-        pytest.param(
-            xr.DataArray(
-                [[0, 1], [2, 3], [4, 5]],
-                dims=("x", "y"),
-                coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                },
-            ),
-            {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
-            xr.DataArray(
-                [[0], [4]],
-                dims=("x", "y"),
-                coords={
-                    "x": ("x", [1, 3], {"units": unit_registry.Unit("m")}),
-                    "y": ("y", [1], {"units": unit_registry.Unit("min")}),
-                },
-            ),
-            None,
-            id="DataArray-compatible units",
-        ),
-        pytest.param(
-            xr.DataArray(
-                [[0, 1], [2, 3], [4, 5]],
-                dims=("x", "y"),
-                coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
-                },
-            ),
-            {"x": Quantity([10, 30], "s"), "y": Quantity([60], "m")},
-            None,
-            KeyError,
-            id="DataArray-incompatible units",
-        ),
-    ),
-)
+@sel_loc_params
 def test_loc(obj, indexers, expected, error):
     obj_ = obj.pint.quantify()
 
@@ -826,8 +824,8 @@ def test_loc(obj, indexers, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -836,8 +834,8 @@ def test_loc(obj, indexers, expected, error):
                 [[-1, 1], [2, 3], [-2, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             None,
@@ -848,8 +846,8 @@ def test_loc(obj, indexers, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
@@ -858,8 +856,8 @@ def test_loc(obj, indexers, expected, error):
                 [[-1, 1], [2, 3], [-2, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             None,
@@ -870,8 +868,8 @@ def test_loc(obj, indexers, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([1, 3], "s"), "y": Quantity([1], "m")},
@@ -885,8 +883,8 @@ def test_loc(obj, indexers, expected, error):
                 Quantity([[0, 1], [2, 3], [4, 5]], "m"),
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -895,8 +893,8 @@ def test_loc(obj, indexers, expected, error):
                 Quantity([[-1, 1], [2, 3], [-2, 5]], "m"),
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             None,
@@ -907,8 +905,8 @@ def test_loc(obj, indexers, expected, error):
                 Quantity([[0, 1], [2, 3], [4, 5]], "m"),
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -917,8 +915,8 @@ def test_loc(obj, indexers, expected, error):
                 Quantity([[-1000, 1], [2, 3], [-2000, 5]], "m"),
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             None,
@@ -929,8 +927,8 @@ def test_loc(obj, indexers, expected, error):
                 Quantity([[0, 1], [2, 3], [4, 5]], "m"),
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -957,15 +955,15 @@ def test_loc_setitem(obj, indexers, values, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
             xr.Dataset(
                 {
-                    "x": ("x", [20], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [20], {"units": unit_dm}),
+                    "y": ("y", [120], {"units": unit_s}),
                 }
             ),
             None,
@@ -974,15 +972,15 @@ def test_loc_setitem(obj, indexers, values, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
             xr.Dataset(
                 {
-                    "x": ("x", [20], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [20], {"units": unit_dm}),
+                    "y": ("y", [120], {"units": unit_s}),
                 }
             ),
             None,
@@ -991,8 +989,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([1, 3], "s"), "y": Quantity([1], "m")},
@@ -1003,8 +1001,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
         pytest.param(
             xr.Dataset(
                 {
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 }
             ),
             {"x": Quantity([10, 30], "m"), "y": Quantity([60], "min")},
@@ -1017,8 +1015,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "dm"), "y": Quantity([60], "s")},
@@ -1026,8 +1024,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[3]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [20], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [20], {"units": unit_dm}),
+                    "y": ("y", [120], {"units": unit_s}),
                 },
             ),
             None,
@@ -1038,8 +1036,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([1, 3], "m"), "y": Quantity([1], "min")},
@@ -1047,8 +1045,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[3]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [20], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [20], {"units": unit_dm}),
+                    "y": ("y", [120], {"units": unit_s}),
                 },
             ),
             None,
@@ -1059,8 +1057,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "s"), "y": Quantity([60], "m")},
@@ -1073,8 +1071,8 @@ def test_loc_setitem(obj, indexers, values, expected, error):
                 [[0, 1], [2, 3], [4, 5]],
                 dims=("x", "y"),
                 coords={
-                    "x": ("x", [10, 20, 30], {"units": unit_registry.Unit("dm")}),
-                    "y": ("y", [60, 120], {"units": unit_registry.Unit("s")}),
+                    "x": ("x", [10, 20, 30], {"units": unit_dm}),
+                    "y": ("y", [60, 120], {"units": unit_s}),
                 },
             ),
             {"x": Quantity([10, 30], "m"), "y": Quantity([60], "min")},
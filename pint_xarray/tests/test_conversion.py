@@ -2,8 +2,9 @@ import numpy as np
 import pandas as pd
 import pint
 import pytest
-from xarray import Coordinates, DataArray, Dataset, Variable
-from xarray.core.indexes import PandasIndex
+from xarray import Coordinates, DataArray, Dataset, IndexVariable, Variable
+from xarray.core.indexes import Index, PandasIndex
+from xarray.testing import _assert_internal_invariants
 
 from pint_xarray import conversion
 from pint_xarray.index import PintIndex
@@ -23,6 +24,15 @@ Unit = unit_registry.Unit
 pytestmark = pytest.mark.filterwarnings("error::pint.UnitStrippedWarning")
 
 
+class PlainIndex(Index):
+    def __init__(self, variables):
+        self.variables = variables
+
+    @classmethod
+    def from_variables(cls, variables, *, options):
+        return cls(variables)
+
+
 def filter_none_values(mapping):
     return {k: v for k, v in mapping.items() if v is not None}
 
@@ -520,6 +530,30 @@ class TestXarrayFunctions:
         actual = conversion.extract_unit_attributes(obj)
         assert expected == actual
 
+    @pytest.mark.parametrize("type", ("DataArray", "Dataset"))
+    def test_extract_units_and_unit_attributes(self, type):
+        obj = Dataset(
+            data_vars={
+                "a": ("x", Quantity([0, 1], "kg")),
+                "b": ("x", [2, 3], {"units": "hPa"}),
+            },
+            coords={
+                "x": ("x", [0, 1], {"units": "m"}),
+                "t": ("x", [4, 5], {"units": "seconds since 2000-01-01"}),
+            },
+        )
+        expected_units = {"a": Unit("kg"), "b": "hPa", "x": "m"}
+        expected_unit_attributes = {"a": None, "b": "hPa", "x": "m"}
+        if type == "DataArray":
+            obj = obj["a"]
+            del expected_units["b"]
+            del expected_unit_attributes["b"]
+
+        units, unit_attributes = conversion.extract_units_and_unit_attributes(obj)
+
+        assert units == expected_units
+        assert unit_attributes == expected_unit_attributes
+
     @pytest.mark.parametrize(
         ["obj", "expected"],
         (
@@ -605,6 +639,82 @@ class TestXarrayFunctions:
             filter_none_values(conversion.extract_unit_attributes(actual)) == expected
         )
 
+    @pytest.mark.parametrize(
+        "variable",
+        (
+            pytest.param(None, id="Dataset"),
+            pytest.param("a", id="DataArray"),
+            pytest.param("x", id="DataArray-dimension_coordinate"),
+            pytest.param("c", id="DataArray-multiindex"),
+        ),
+    )
+    def test_dequantify(self, variable):
+        a = np.linspace(-1, 1, 5)
+        b = np.linspace(0, 1, 5)
+        c = np.arange(4)
+        x = np.linspace(0, 100, 5)
+        u = np.arange(5)
+        t = np.arange(2)
+        time_units = "days since 2000-01-01"
+        mindex = pd.MultiIndex.from_product([["a", "b"], [1, 2]], names=("l1", "l2"))
+        mindex_coords = Coordinates.from_pandas_multiindex(mindex, "z")
+
+        obj = conversion.attach_units(
+            Dataset(
+                {"a": ("x", a), "b": ("x", b, {"units": "hPa"}), "c": ("z", c)},
+                coords={"x": x, "u": ("x", u), "t": ("t", t, {"units": time_units})},
+            ).assign_coords(mindex_coords),
+            {"a": Unit("K"), "c": Unit("m"), "u": Unit("m"), "x": Unit("s")},
+        )
+        units = {"a": "K", "c": "m", "u": "m", "x": "s"}
+        expected = Dataset(
+            {
+                "a": ("x", a, {"units": "K"}),
+                "b": ("x", b),
+                "c": ("z", c, {"units": "m"}),
+            },
+            coords={
+                "x": ("x", x, {"units": "s"}),
+                "u": ("x", u, {"units": "m"}),
+                "t": ("t", t, {"units": time_units}),
+            },
+        ).assign_coords(mindex_coords)
+
+        if variable is not None:
+            obj = obj[variable]
+            expected = expected[variable]
+
+        actual = conversion.dequantify(obj, units)
+        assert_identical(actual, expected)
+        _assert_internal_invariants(actual, check_default_indexes=False)
+
+        assert all(
+            actual.coords[name].attrs == expected.coords[name].attrs
+            for name in expected.coords
+        )
+        if "x" in actual.coords:
+            assert not isinstance(actual.xindexes["x"], PintIndex)
+            assert isinstance(actual.coords.variables["x"], IndexVariable)
+
+    def test_dequantify_index_returning_input_variables(self):
+        # the default `Index.create_variables` returns the variables it was given
+        x = np.linspace(0, 100, 5)
+        obj = conversion.attach_units(
+            Dataset(coords={"x": ("x", x)})
+            .drop_indexes("x")
+            .set_xindex("x", PlainIndex),
+            {"x": Unit("m")},
+        )
+        expected = Dataset(coords={"x": ("x", x, {"units": "m"})})
+
+        actual = conversion.dequantify(obj, {"x": "m"})
+
+        assert_identical(actual, expected)
+        assert isinstance(actual.xindexes["x"], PlainIndex)
+        assert not isinstance(actual["x"].data, pint.Quantity)
+        assert obj["x"].attrs == {}
+        assert isinstance(obj["x"].data, pint.Quantity)
+
 
 class TestIndexerFunctions:
     @pytest.mark.parametrize(
@@ -848,3 +958,39 @@ class TestIndexerFunctions:
         actual = conversion.strip_indexer_units(indexers)
 
         assert_indexers_equal(actual, expected)
+
+    @pytest.mark.parametrize(
+        ["indexers", "expected_units", "expected_stripped"],
+        (
+            pytest.param({"x": 1}, {"x": None}, {"x": 1}, id="scalar-no units"),
+            pytest.param(
+                {"x": Quantity([1, 2], "s")},
+                {"x": Unit("s")},
+                {"x": np.array([1, 2])},
+                id="array-units",
+            ),
+            pytest.param(
+                {"x": Variable("x", Quantity([1, 2], "m"))},
+                {"x": Unit("m")},
+                {"x": Variable("x", [1, 2])},
+                id="Variable-units",
+            ),
+            pytest.param(
+                {"x": DataArray(Quantity([1, 2], "s"), dims="x")},
+                {"x": Unit("s")},
+                {"x": DataArray([1, 2], dims="x")},
+                id="DataArray-units",
+            ),
+            pytest.param(
+                {"x": slice(Quantity(1, "m"), Quantity(2, "m")), "y": slice(1, None)},
+                {"x": Unit("m"), "y": None},
+                {"x": slice(1, 2), "y": slice(1, None)},
+                id="slices",
+            ),
+        ),
+    )
+    def test_split_indexer_units(self, indexers, expected_units, expected_stripped):
+        units, stripped = conversion.split_indexer_units(indexers)
+
+        assert units == expected_units
+        assert_indexers_equal(stripped, expected_stripped)
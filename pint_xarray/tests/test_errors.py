@@ -0,0 +1,71 @@
+import pytest
+
+from pint_xarray.errors import format_error_message
+
+
+@pytest.mark.parametrize(
+    ["mapping", "op", "expected"],
+    (
+        pytest.param(
+            {"a": ("m", ValueError("error"))},
+            "attach",
+            "Cannot attach units:\n"
+            "    cannot attach units to variable 'a': m (reason: error)",
+            id="attach-single",
+        ),
+        pytest.param(
+            {"a": ("m", ValueError("error 1")), "b": ("s", ValueError("error 2"))},
+            "attach",
+            "Cannot attach units:\n"
+            " -- cannot attach units to variable 'a': m (reason: error 1)\n"
+            " -- cannot attach units to variable 'b': s (reason: error 2)",
+            id="attach-multiple",
+        ),
+        pytest.param(
+            {"a": ("abc", "attribute", ValueError("error"))},
+            "parse",
+            "Cannot parse units:\n"
+            "    invalid units for variable 'a': abc (attribute) (reason: error)",
+            id="parse",
+        ),
+        pytest.param(
+            {"a": ValueError("error 1"), "b": ValueError("error 2")},
+            "convert",
+            "Cannot convert variables:\n"
+            " -- incompatible units for variable 'a': error 1\n"
+            " -- incompatible units for variable 'b': error 2",
+            id="convert",
+        ),
+        pytest.param(
+            {"x": ValueError("error")},
+            "convert_indexers",
+            "Cannot convert indexers:\n"
+            "    incompatible units for indexer for 'x': error",
+            id="convert_indexers",
+        ),
+    ),
+)
+def test_format_error_message(mapping, op, expected):
+    actual = format_error_message(mapping, op)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    ["op", "expected"],
+    (
+        ("attach", "Cannot attach units:"),
+        ("parse", "Cannot parse units:"),
+        ("convert", "Cannot convert variables:"),
+        ("convert_indexers", "Cannot convert indexers:"),
+    ),
+)
+def test_format_error_message_empty(op, expected):
+    actual = format_error_message({}, op)
+
+    assert actual == expected
+
+
+def test_format_error_message_invalid_op():
+    with pytest.raises(ValueError, match="invalid op"):
+        format_error_message({}, "unknown")
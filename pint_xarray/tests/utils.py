@@ -62,6 +62,15 @@ def assert_array_equal(a, b):
     np.testing.assert_array_equal(a_, b_)
 
 
+def assert_wraps_no_copy(result, orig):
+    __tracebackhide__ = True
+
+    result_ = getattr(result, "magnitude", result)
+    orig_ = getattr(orig, "magnitude", orig)
+
+    assert np.shares_memory(result_, orig_), "the data has been copied"
+
+
 def assert_slice_equal(a, b):
     attrs = ("start", "stop", "step")
     values_a = tuple(getattr(a, name) for name in attrs)